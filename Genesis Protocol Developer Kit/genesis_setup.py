@@ -29,11 +29,18 @@ This script handles the initial setup of the Genesis Protocol Developer Kit,
 including installing required dependencies and preparing the environment.
 """
 
+import hashlib
+import json
 import os
+import re
+import shutil
 import sys
 import subprocess
+import venv
 import logging
+from functools import cached_property
 from pathlib import Path
+from types import MappingProxyType
 from typing import List
 
 # Basic logging setup
@@ -44,129 +51,134 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Requirement tables are logical constants: hoisted to module level as
+# immutable tuples/proxies so every GenesisSetup() shares one copy and
+# nothing can mutate them in long-running sessions.
+
+# Core requirements for the Genesis Kit
+CORE_REQUIREMENTS = (
+    "questionary>=2.0.0",
+    "rich>=13.0.0",
+    "python-dotenv>=1.0.0",
+    "pydantic>=2.0.0",
+    "colorama>=0.4.6",
+    "typer>=0.9.0",
+    "click>=8.0.0",
+    "jinja2>=3.0.0",
+    "pyyaml>=6.0.0",
+    "toml>=0.10.0"
+)
+
+# Optional tool-specific requirements
+TOOL_REQUIREMENTS = MappingProxyType({
+    "development": (
+        "black>=23.0.0",
+        "flake8>=6.0.0",
+        "mypy>=1.0.0",
+        "pytest>=7.0.0",
+        "pytest-cov>=4.0.0",
+        "pre-commit>=3.0.0"
+    ),
+    "documentation": (
+        "mkdocs>=1.5.0",
+        "mkdocs-material>=9.0.0",
+        "mkdocstrings>=0.22.0"
+    ),
+    "ai_tools": (
+        "langchain>=0.1.0",
+        "openai>=1.0.0",
+        "chromadb>=0.4.0",
+        "tiktoken>=0.5.0"
+    )
+})
+
+# Archetype-specific requirements, flattened to a single table keyed by
+# (archetype, kind) so a lookup is one hash probe and the data stays
+# immutable. Use requirements_for() to get the merged tuple for an archetype.
+ARCH_REQS = MappingProxyType({
+    ("alchemist", "core"): (
+        "tensorflow>=2.13.0",
+        "torch>=2.0.0",
+        "jupyter>=1.0.0",
+        "scikit-learn>=1.3.0"
+    ),
+    ("alchemist", "optional"): (
+        "optuna>=3.3.0",
+        "mlflow>=2.7.0",
+        "wandb>=0.15.0"
+    ),
+    ("sentinel", "core"): (
+        "fastapi>=0.100.0",
+        "pydantic>=2.0.0",
+        "authlib>=1.2.0",
+        "cryptography>=41.0.0"
+    ),
+    ("sentinel", "optional"): (
+        "bandit>=1.7.5",
+        "safety>=2.3.0",
+        "owasp-dependency-check>=8.4.0"
+    ),
+    ("oracle", "core"): (
+        "pandas>=2.0.0",
+        "numpy>=1.24.0",
+        "langchain>=0.0.200",
+        "chromadb>=0.4.0"
+    ),
+    ("oracle", "optional"): (
+        "plotly>=5.16.0",
+        "streamlit>=1.26.0",
+        "great-expectations>=0.17.0"
+    ),
+    ("engineer", "core"): (
+        "fastapi>=0.100.0",
+        "sqlalchemy>=2.0.0",
+        "alembic>=1.12.0",
+        "pydantic>=2.0.0"
+    ),
+    ("engineer", "optional"): (
+        "docker>=6.1.0",
+        "kubernetes>=28.1.0",
+        "terraform-provider>=0.5.0"
+    ),
+    ("innovator", "core"): (
+        "langchain>=0.0.200",
+        "openai>=0.28.0",
+        "chromadb>=0.4.0",
+        "tiktoken>=0.5.0"
+    ),
+    ("innovator", "optional"): (
+        "anthropic>=0.3.0",
+        "groq>=0.3.0",
+        "mistralai>=0.0.7"
+    ),
+    ("lorekeeper", "core"): (
+        "elasticsearch>=8.10.0",
+        "whoosh>=2.7.4",
+        "sqlalchemy>=2.0.0",
+        "fastapi>=0.100.0"
+    ),
+    ("lorekeeper", "optional"): (
+        "sphinx>=7.1.0",
+        "mkdocs>=1.5.0",
+        "mkdocstrings>=0.23.0"
+    )
+})
+
+def requirements_for(archetype: str, include_optional: bool = False) -> tuple:
+    """Return the requirement specs for an archetype as a flat tuple."""
+    core = ARCH_REQS[archetype, "core"]
+    return core + ARCH_REQS[archetype, "optional"] if include_optional else core
+
 class GenesisSetup:
     def __init__(self):
         self.base_dir = Path(__file__).parent
         self.requirements_file = self.base_dir / "requirements.txt"
+        self.lock_file = self.base_dir / "requirements.lock"
+        self.lock_input_hash_file = self.base_dir / ".genesis-lock-input.sha256"
 
-        # Core requirements for the Genesis Kit
-        self.core_requirements = [
-            "questionary>=2.0.0",
-            "rich>=13.0.0",
-            "python-dotenv>=1.0.0",
-            "pydantic>=2.0.0",
-            "colorama>=0.4.6",
-            "typer>=0.9.0",
-            "click>=8.0.0",
-            "jinja2>=3.0.0",
-            "pyyaml>=6.0.0",
-            "toml>=0.10.0"
-        ]
-
-        # Optional tool-specific requirements
-        self.tool_requirements = {
-            "development": [
-                "black>=23.0.0",
-                "flake8>=6.0.0",
-                "mypy>=1.0.0",
-                "pytest>=7.0.0",
-                "pytest-cov>=4.0.0",
-                "pre-commit>=3.0.0"
-            ],
-            "documentation": [
-                "mkdocs>=1.5.0",
-                "mkdocs-material>=9.0.0",
-                "mkdocstrings>=0.22.0"
-            ],
-            "ai_tools": [
-                "langchain>=0.1.0",
-                "openai>=1.0.0",
-                "chromadb>=0.4.0",
-                "tiktoken>=0.5.0"
-            ]
-        }
-
-        # Archetype-specific requirements
-        self.archetype_requirements = {
-            "alchemist": {
-                "core": [
-                    "tensorflow>=2.13.0",
-                    "torch>=2.0.0",
-                    "jupyter>=1.0.0",
-                    "scikit-learn>=1.3.0"
-                ],
-                "optional": [
-                    "optuna>=3.3.0",
-                    "mlflow>=2.7.0",
-                    "wandb>=0.15.0"
-                ]
-            },
-            "sentinel": {
-                "core": [
-                    "fastapi>=0.100.0",
-                    "pydantic>=2.0.0",
-                    "authlib>=1.2.0",
-                    "cryptography>=41.0.0"
-                ],
-                "optional": [
-                    "bandit>=1.7.5",
-                    "safety>=2.3.0",
-                    "owasp-dependency-check>=8.4.0"
-                ]
-            },
-            "oracle": {
-                "core": [
-                    "pandas>=2.0.0",
-                    "numpy>=1.24.0",
-                    "langchain>=0.0.200",
-                    "chromadb>=0.4.0"
-                ],
-                "optional": [
-                    "plotly>=5.16.0",
-                    "streamlit>=1.26.0",
-                    "great-expectations>=0.17.0"
-                ]
-            },
-            "engineer": {
-                "core": [
-                    "fastapi>=0.100.0",
-                    "sqlalchemy>=2.0.0",
-                    "alembic>=1.12.0",
-                    "pydantic>=2.0.0"
-                ],
-                "optional": [
-                    "docker>=6.1.0",
-                    "kubernetes>=28.1.0",
-                    "terraform-provider>=0.5.0"
-                ]
-            },
-            "innovator": {
-                "core": [
-                    "langchain>=0.0.200",
-                    "openai>=0.28.0",
-                    "chromadb>=0.4.0",
-                    "tiktoken>=0.5.0"
-                ],
-                "optional": [
-                    "anthropic>=0.3.0",
-                    "groq>=0.3.0",
-                    "mistralai>=0.0.7"
-                ]
-            },
-            "lorekeeper": {
-                "core": [
-                    "elasticsearch>=8.10.0",
-                    "whoosh>=2.7.4",
-                    "sqlalchemy>=2.0.0",
-                    "fastapi>=0.100.0"
-                ],
-                "optional": [
-                    "sphinx>=7.1.0",
-                    "mkdocs>=1.5.0",
-                    "mkdocstrings>=0.23.0"
-                ]
-            }
-        }
+        self.core_requirements = CORE_REQUIREMENTS
+        self.tool_requirements = TOOL_REQUIREMENTS
+        self.archetype_requirements = ARCH_REQS
 
     def check_python_version(self) -> bool:
         """Check if Python version meets requirements."""
@@ -182,64 +194,315 @@ class GenesisSetup:
         return True
 
     def create_virtual_environment(self) -> bool:
-        """Create a virtual environment for the kit."""
+        """Create a virtual environment for the kit.
+
+        The venv is created without pip (ensurepip is the slowest phase of
+        venv creation, especially on Windows); pip is bootstrapped lazily
+        via ensure_pip() only when packages actually need installing.
+        """
         try:
             venv_path = self.base_dir / "venv"
             if not venv_path.exists():
                 logger.info("Creating virtual environment...")
-                subprocess.run([sys.executable, "-m", "venv", str(venv_path)], check=True)
+                venv.EnvBuilder(
+                    with_pip=False,
+                    symlinks=os.name != "nt",
+                    clear=False
+                ).create(venv_path)
                 logger.info("Virtual environment created successfully")
             return True
-        except subprocess.CalledProcessError as e:
+        except OSError as e:
             logger.error(f"Failed to create virtual environment: {str(e)}")
             return False
 
-    def get_venv_python(self) -> str:
-        """Get the path to the virtual environment Python executable."""
+    def ensure_pip(self) -> bool:
+        """Bootstrap pip into the venv if it isn't there yet."""
+        pip_name = "pip.exe" if sys.platform == "win32" else "pip"
+        bin_dir = "Scripts" if sys.platform == "win32" else "bin"
+        if (self.base_dir / "venv" / bin_dir / pip_name).exists():
+            return True
+        try:
+            subprocess.run(
+                [self.venv_python, "-m", "ensurepip", "--upgrade", "--default-pip"],
+                check=True
+            )
+            return True
+        except subprocess.CalledProcessError as e:
+            logger.error(f"Failed to bootstrap pip: {str(e)}")
+            return False
+
+    @cached_property
+    def venv_python(self) -> str:
+        """Path to the virtual environment Python executable (computed once)."""
         if sys.platform == "win32":
             return str(self.base_dir / "venv" / "Scripts" / "python.exe")
         return str(self.base_dir / "venv" / "bin" / "python")
 
-    def install_requirements(self, requirements: List[str]) -> bool:
-        """Install the specified requirements."""
+    def get_pip_cache_dir(self) -> Path:
+        """Get the pip cache directory, honoring the GENESIS_PIP_CACHE override."""
+        cache_dir = Path(os.environ.get(
+            "GENESIS_PIP_CACHE",
+            Path.home() / ".cache" / "genesis-pip"
+        ))
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        return cache_dir
+
+    def install_requirements(self, requirements: List[str], no_deps: bool = False) -> bool:
+        """Install the specified requirements, streaming pip's output.
+
+        Prefers `uv pip install` when uv is on PATH: its compiled resolver
+        is far faster than pip's backtracker on the large archetype sets.
+        """
+        venv_pip = self.venv_python
+        uv_path = shutil.which("uv")
+        if uv_path:
+            argv = [uv_path, "pip", "install", "--python", venv_pip]
+        else:
+            argv = [venv_pip, "-m", "pip", "install",
+                    "--cache-dir", str(self.get_pip_cache_dir()),
+                    "--prefer-binary",
+                    "--disable-pip-version-check", "--no-input"]
+        if no_deps:
+            argv.append("--no-deps")
+        argv += list(requirements)
+        process = subprocess.Popen(
+            argv,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1
+        )
+        # Log line-by-line so progress is visible and memory stays flat
+        for line in process.stdout:
+            logger.info(line.rstrip())
+        process.wait()
+
+        if process.returncode != 0:
+            logger.error(f"Failed to install requirements (exit code {process.returncode})")
+            return False
+        return True
+
+    def install_archetype_requirements(self, archetype: str,
+                                       include_optional: bool = True,
+                                       fast_optional: bool = False) -> bool:
+        """Install an archetype's core and optional requirement layers.
+
+        The optional layer shares its transitive dependencies with the core
+        layer, so once core is resolved and installed, fast_optional can
+        install the optional packages with --no-deps and skip pip's
+        resolver entirely (the "resolve once, install many" pattern).
+        """
+        print(f"\n📦 Installing {archetype} core requirements...")
+        if not self.install_requirements(requirements_for(archetype)):
+            return False
+        if not include_optional:
+            return True
+        print(f"\n📦 Installing {archetype} optional requirements...")
+        return self.install_requirements(
+            ARCH_REQS[archetype, "optional"],
+            no_deps=fast_optional
+        )
+
+    def install_requirement_groups(self, groups, parallel_installs: int = 4) -> bool:
+        """Install independent requirement groups, concurrently when allowed.
+
+        Each group targets a separate pip process, so the installs are
+        I/O-bound on PyPI fetches and overlap well. Passing
+        ``parallel_installs=0`` merges all groups into a single pip call.
+        """
+        if parallel_installs <= 0 or len(groups) == 1:
+            merged = []
+            for _, pkgs in groups:
+                merged.extend(pkgs)
+            print("\n📦 Installing optional components...")
+            return self.install_requirements(merged)
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(parallel_installs, len(groups))) as executor:
+            futures = {}
+            for label, pkgs in groups:
+                print(f"\n📦 Installing {label}...")
+                futures[label] = executor.submit(self.install_requirements, pkgs)
+            results = {label: future.result() for label, future in futures.items()}
+
+        for label, ok in results.items():
+            if not ok:
+                logger.error(f"Installation of {label} failed")
+        return all(results.values())
+
+    @staticmethod
+    def _canonical(name: str) -> str:
+        """Canonicalize a package name (PEP 503 style)."""
+        return re.sub(r"[-_.]+", "-", name).strip().lower()
+
+    def _merge_requirements(self, specs: List[str]) -> List[str]:
+        """Deduplicate requirement specs by package name.
+
+        When the same package appears with several lower bounds, keep the
+        tightest (highest) one so pip's resolver never has to reconcile
+        redundant constraints.
+        """
         try:
-            venv_pip = self.get_venv_python()
-            process = subprocess.run(
-                [venv_pip, "-m", "pip", "install"] + requirements,
-                check=True,
-                capture_output=True,
-                text=True
+            from packaging.requirements import Requirement
+            from packaging.utils import canonicalize_name
+            from packaging.version import Version
+        except ImportError:
+            # Fall back to name-level dedupe, first spec wins
+            merged = {}
+            for spec in specs:
+                name = self._canonical(re.split(r"[<>=!~\[; ]", spec, 1)[0])
+                merged.setdefault(name, spec)
+            return sorted(merged.values(), key=str.lower)
+
+        def lower_bound(req) -> "Version":
+            bounds = [
+                Version(s.version)
+                for s in req.specifier
+                if s.operator in (">=", ">", "==", "~=")
+            ]
+            return max(bounds) if bounds else Version("0")
+
+        merged = {}
+        for spec in specs:
+            req = Requirement(spec)
+            name = canonicalize_name(req.name)
+            current = merged.get(name)
+            if current is None or lower_bound(req) > lower_bound(current):
+                merged[name] = req
+        return [str(r) for r in sorted(merged.values(), key=lambda r: r.name.lower())]
+
+    def _write_lockfile(self) -> None:
+        """Freeze the resolved environment into requirements.lock.
+
+        A fully pinned lockfile lets later installs bypass pip's resolver
+        entirely; the input hash records which requirements.txt the lock
+        was derived from.
+        """
+        try:
+            proc = subprocess.run(
+                [self.venv_python, "-m", "pip", "freeze", "--exclude-editable"],
+                stdout=subprocess.PIPE,
+                text=True,
+                check=True
             )
-            logger.info(process.stdout)
-            return True
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Failed to install requirements: {e.stderr}")
-            return False
+        except (subprocess.CalledProcessError, OSError) as e:
+            logger.warning(f"Could not write requirements.lock: {str(e)}")
+            return
+        self.lock_file.write_text(proc.stdout)
+        self.lock_input_hash_file.write_text(self._requirements_hash())
+        logger.info("Wrote requirements.lock")
+
+    def _lockfile_current(self, req_hash: str) -> bool:
+        """Check whether requirements.lock was derived from this requirements.txt."""
+        return (
+            self.lock_file.exists()
+            and self.lock_input_hash_file.exists()
+            and self.lock_input_hash_file.read_text().strip() == req_hash
+        )
+
+    def _requirements_hash(self) -> str:
+        """Fingerprint requirements.txt so unchanged re-runs can be skipped."""
+        return hashlib.sha256(self.requirements_file.read_bytes()).hexdigest()
 
     def generate_requirements_file(self) -> None:
         """Generate requirements.txt with all dependencies."""
-        all_requirements = self.core_requirements.copy()
+        all_requirements = list(self.core_requirements)
         for category in self.tool_requirements.values():
             all_requirements.extend(category)
+        all_requirements = self._merge_requirements(all_requirements)
 
-        with open(self.requirements_file, "w") as f:
-            f.write("\n".join(all_requirements))
+        # Write atomically so an interrupted run can't leave a truncated file
+        payload = ("\n".join(all_requirements) + "\n").encode("utf-8")
+        tmp = self.requirements_file.with_suffix(".txt.tmp")
+        tmp.write_bytes(payload)
+        os.replace(tmp, self.requirements_file)
 
         logger.info("Generated requirements.txt")
 
     def setup_git_hooks(self) -> None:
         """Set up Git hooks for development."""
+        hook = self.base_dir / ".git" / "hooks" / "pre-commit"
+        hook_hash_file = self.base_dir / ".git" / "hooks" / ".genesis-pre-commit.sha256"
+        config = self.base_dir / ".pre-commit-config.yaml"
+        config_hash = (
+            hashlib.sha256(config.read_bytes()).hexdigest() if config.exists() else ""
+        )
+
+        # Skip the pre-commit subprocess entirely when the hook is already
+        # installed and the config hasn't changed since.
+        hook_installed = hook.exists() and b"pre-commit" in hook.read_bytes()
+        if hook_installed and hook_hash_file.exists() \
+                and hook_hash_file.read_text().strip() == config_hash:
+            logger.info("Git hooks already installed, skipping")
+            return
+
         try:
-            subprocess.run(
-                [self.get_venv_python(), "-m", "pre-commit", "install"],
-                check=True,
-                cwd=self.base_dir
-            )
+            cmd = [self.venv_python, "-m", "pre-commit", "install"]
+            if hook_installed:
+                # Config changed: refresh the hook environments too
+                cmd.append("--install-hooks")
+            subprocess.run(cmd, check=True, cwd=self.base_dir)
+            hook_hash_file.write_text(config_hash)
             logger.info("Git hooks installed successfully")
         except subprocess.CalledProcessError as e:
             logger.warning(f"Failed to set up Git hooks: {str(e)}")
 
-    def run_setup(self) -> None:
+    def _prompt_component_selection(self):
+        """Run the component checkbox prompt with the venv interpreter.
+
+        The host interpreter may not have questionary, but the venv just
+        received it as a core requirement. Running only the prompt inside
+        the venv picks up the fresh install and avoids the wasteful
+        "install every optional group" fallback. Returns the selected
+        TOOL_REQUIREMENTS keys, or None when no prompt could be shown.
+
+        The child's stdout stays attached to the terminal so questionary
+        can render the checkbox; the selection comes back through a temp
+        file instead of a captured pipe.
+        """
+        script = (
+            "import json, sys\n"
+            "try:\n"
+            "    import questionary\n"
+            "except ImportError:\n"
+            "    sys.exit(3)\n"
+            "selected = questionary.checkbox(\n"
+            "    'Choose additional components:',\n"
+            "    choices=[\n"
+            "        questionary.Choice(\n"
+            "            'Development Tools (black, flake8, pytest, etc.)',\n"
+            "            value='development'),\n"
+            "        questionary.Choice(\n"
+            "            'Documentation Tools (mkdocs, mkdocs-material)',\n"
+            "            value='documentation'),\n"
+            "        questionary.Choice(\n"
+            "            'AI Tools (langchain, openai, chromadb)',\n"
+            "            value='ai_tools'),\n"
+            "    ]\n"
+            ").ask()\n"
+            "with open(sys.argv[1], 'w') as out:\n"
+            "    json.dump(selected or [], out)\n"
+        )
+        import tempfile
+        fd, result_path = tempfile.mkstemp(prefix="genesis-components-", suffix=".json")
+        os.close(fd)
+        try:
+            subprocess.run(
+                [self.venv_python, "-c", script, result_path],
+                check=True
+            )
+            with open(result_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (subprocess.CalledProcessError, OSError, ValueError):
+            return None
+        finally:
+            try:
+                os.unlink(result_path)
+            except OSError:
+                pass
+
+    def run_setup(self, parallel_installs: int = 4) -> None:
         """Run the complete setup process."""
         print("\n🚀 Setting up Genesis Protocol Developer Kit...\n")
 
@@ -254,46 +517,68 @@ class GenesisSetup:
         # Generate requirements.txt
         self.generate_requirements_file()
 
-        # Install core requirements
-        print("\n📦 Installing core requirements...")
-        if not self.install_requirements(self.core_requirements):
-            sys.exit(1)
+        # Skip installation entirely when nothing changed since the last run
+        req_hash = self._requirements_hash()
+        hash_marker = self.base_dir / "venv" / ".genesis-reqs.sha256"
+        if hash_marker.exists() and hash_marker.read_text().strip() == req_hash:
+            logger.info("Environment up to date, skipping installation")
+            print("\n✅ Environment already up to date, nothing to install.")
+        elif self._lockfile_current(req_hash):
+            # A lockfile derived from this exact requirements.txt exists
+            # (e.g. the venv was recreated): install the pinned set with
+            # --no-deps, which skips dependency resolution entirely.
+            print("\n📦 Installing pinned requirements from requirements.lock...")
+            if not self.ensure_pip():
+                sys.exit(1)
+            if not self.install_requirements(["-r", str(self.lock_file)], no_deps=True):
+                sys.exit(1)
+            hash_marker.write_text(req_hash)
+        else:
+            # Bootstrap pip only now that we know packages need installing
+            if not self.ensure_pip():
+                sys.exit(1)
 
-        # Ask for optional components
-        print("\n🎯 Select additional components to install:\n")
-        try:
-            import questionary
-            from rich.console import Console
-
-            console = Console()
-            selected_components = questionary.checkbox(
-                "Choose additional components:",
-                choices=[
-                    "Development Tools (black, flake8, pytest, etc.)",
-                    "Documentation Tools (mkdocs, mkdocs-material)",
-                    "AI Tools (langchain, openai, chromadb)"
-                ]
-            ).ask()
-
-            # Install selected components
-            if "Development Tools" in selected_components:
-                print("\n🛠️  Installing development tools...")
-                self.install_requirements(self.tool_requirements["development"])
-                self.setup_git_hooks()
+            # Install core requirements first; optional groups may depend on them.
+            print("\n📦 Installing core requirements...")
+            if not self.install_requirements(self.core_requirements):
+                sys.exit(1)
 
-            if "Documentation Tools" in selected_components:
-                print("\n📚 Installing documentation tools...")
-                self.install_requirements(self.tool_requirements["documentation"])
+            # Ask for optional components
+            print("\n🎯 Select additional components to install:\n")
+            groups = []
+            setup_hooks = False
+            selected_components = self._prompt_component_selection()
+            if selected_components is None:
+                # Prompt unavailable: install everything
+                groups = [(label, pkgs) for label, pkgs in self.tool_requirements.items()]
+            else:
+                # The prompt returns TOOL_REQUIREMENTS keys, not the
+                # display labels, so selections map straight to groups
+                if "development" in selected_components:
+                    groups.append(("development tools", self.tool_requirements["development"]))
+                    setup_hooks = True
 
-            if "AI Tools" in selected_components:
-                print("\n🤖 Installing AI tools...")
-                self.install_requirements(self.tool_requirements["ai_tools"])
+                if "documentation" in selected_components:
+                    groups.append(("documentation tools", self.tool_requirements["documentation"]))
 
-        except ImportError:
-            # If questionary isn't available yet, install everything
-            print("\n📦 Installing all components...")
-            for requirements in self.tool_requirements.values():
-                self.install_requirements(requirements)
+                if "ai_tools" in selected_components:
+                    groups.append(("AI tools", self.tool_requirements["ai_tools"]))
+
+            if groups:
+                if not self.install_requirement_groups(groups, parallel_installs):
+                    sys.exit(1)
+
+            if setup_hooks:
+                self.setup_git_hooks()
+
+            # The skip marker and lockfile declare the environment fully
+            # provisioned, but requirements.txt always lists every optional
+            # group. After a partial selection, writing them would make
+            # later runs skip straight past the groups that were left out,
+            # so they are only written when everything was installed.
+            if len(groups) == len(self.tool_requirements):
+                self._write_lockfile()
+                hash_marker.write_text(req_hash)
 
         print("\n✨ Genesis Protocol Developer Kit setup completed!\n")
         print("Next steps:")
@@ -307,5 +592,33 @@ class GenesisSetup:
         print("\nHappy developing! 🎮\n")
 
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Genesis Protocol Developer Kit Setup")
+    parser.add_argument(
+        "--parallel-installs",
+        type=int,
+        default=4,
+        help="Max concurrent pip installs for optional groups (0 disables)"
+    )
+    parser.add_argument(
+        "--archetype",
+        choices=sorted({arch for arch, _ in ARCH_REQS}),
+        help="Also install the requirements for a project archetype"
+    )
+    parser.add_argument(
+        "--no-deps-optional",
+        action="store_true",
+        help="Install archetype optional packages with --no-deps "
+             "(their dependencies are already satisfied by the core layer)"
+    )
+    args = parser.parse_args()
+
     setup = GenesisSetup()
-    setup.run_setup()
+    setup.run_setup(parallel_installs=args.parallel_installs)
+    if args.archetype:
+        if not setup.install_archetype_requirements(
+            args.archetype,
+            fast_optional=args.no_deps_optional
+        ):
+            sys.exit(1)
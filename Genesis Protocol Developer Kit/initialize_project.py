@@ -30,9 +30,12 @@ including project profiling, environment setup, and structure creation.
 """
 
 import os
+import sys
 import json
 import shutil
 import logging
+import threading
+import time
 from pathlib import Path
 from typing import Dict, Optional
 from datetime import datetime
@@ -43,9 +46,20 @@ try:
     from rich.panel import Panel
     from rich.markdown import Markdown
 except ImportError:
+    # Only bootstrap via pip once per environment; a marker next to the
+    # interpreter records that it already happened, so repeat failures
+    # mean the wrong interpreter is active rather than missing packages.
+    _bootstrap_marker = Path(sys.prefix) / ".genesis-bootstrap-ok"
+    if _bootstrap_marker.exists():
+        print(
+            "Required packages are missing even though they were installed "
+            "previously. Activate the project virtual environment and retry."
+        )
+        sys.exit(1)
     print("Installing required packages...")
     import subprocess
     subprocess.check_call(["pip", "install", "questionary", "rich"])
+    _bootstrap_marker.touch()
     import questionary
     from rich.console import Console
     from rich.panel import Panel
@@ -173,8 +187,17 @@ class ProjectInitializer:
                 f"Directory {project_name} already exists. Overwrite?"
             ).ask():
                 raise Exception("Project directory already exists")
-            shutil.rmtree(project_dir)
-        
+            # Rename is O(1); delete the old tree in the background so the
+            # new initialization isn't blocked walking it
+            old = project_dir.with_name(f"{project_name}.old.{int(time.time())}")
+            os.replace(project_dir, old)
+            threading.Thread(
+                target=shutil.rmtree,
+                args=(old,),
+                kwargs={"ignore_errors": True},
+                daemon=False
+            ).start()
+
         project_dir.mkdir(parents=True)
         self.logger.info(f"Created project directory: {project_dir}")
         return project_dir
@@ -203,10 +226,16 @@ class ProjectInitializer:
         elif archetype == "Craftsman":
             directories.extend(["components", "templates", "assets"])
         
-        # Create directories
-        for directory in directories:
-            (self.project_dir / directory).mkdir(parents=True, exist_ok=True)
-        
+        # Create directories: ensure the root once, then a plain mkdir per
+        # leaf. Depth-sorting means parents are always created before
+        # children, so no per-call parents=True re-traversal is needed.
+        self.project_dir.mkdir(parents=True, exist_ok=True)
+        for directory in sorted(set(directories), key=lambda d: d.count("/")):
+            try:
+                os.mkdir(self.project_dir / directory)
+            except FileExistsError:
+                pass
+
         self.logger.info("Project structure generated")
     
     def _create_env_files(self) -> None:
@@ -214,7 +243,9 @@ class ProjectInitializer:
         # Copy .env.example template
         env_example = self.templates_dir / ".env.example"
         if env_example.exists():
-            shutil.copy(env_example, self.project_dir / ".env.example")
+            # copyfile skips the stat/chmod that copy() does; templates
+            # don't need their permissions propagated
+            shutil.copyfile(env_example, self.project_dir / ".env.example")
         
         # Create .env with basic configuration
         env_content = [
@@ -240,9 +271,9 @@ class ProjectInitializer:
             ""
         ]
         
-        with open(self.project_dir / ".env", "w") as f:
-            f.write("\n".join(env_content))
-        
+        # One bytes write: no TextIOWrapper, no CRLF translation on Windows
+        (self.project_dir / ".env").write_bytes("\n".join(env_content).encode("utf-8"))
+
         self.logger.info("Environment files created")
     
     def _generate_documentation(self) -> None:
@@ -266,11 +297,18 @@ class ProjectInitializer:
         # Generate technical documentation
         tech_doc_template = self.templates_dir / "technical_docs_template.md"
         if tech_doc_template.exists():
-            shutil.copy(tech_doc_template, docs_dir / "technical_documentation.md")
+            shutil.copyfile(tech_doc_template, docs_dir / "technical_documentation.md")
         
-        # Save project profile
-        with open(docs_dir / "project_profile.json", "w") as f:
-            json.dump(self.project_profile, f, indent=2)
+        # Save project profile (orjson serializes in C and writes bytes
+        # in one shot; stdlib json is the fallback)
+        try:
+            import orjson
+            (docs_dir / "project_profile.json").write_bytes(
+                orjson.dumps(self.project_profile, option=orjson.OPT_INDENT_2)
+            )
+        except ImportError:
+            with open(docs_dir / "project_profile.json", "w") as f:
+                json.dump(self.project_profile, f, indent=2)
         
         self.logger.info("Project documentation generated")
     
@@ -278,23 +316,24 @@ class ProjectInitializer:
         """Initialize git repository."""
         try:
             import subprocess
-            
-            # Initialize git
-            subprocess.run(["git", "init"], cwd=self.project_dir, check=True)
-            
-            # Copy gitignore template
+
+            # Copy gitignore template before staging so it lands in the commit
             gitignore_template = self.templates_dir / "gitignore_template"
             if gitignore_template.exists():
-                shutil.copy(gitignore_template, self.project_dir / ".gitignore")
-            
-            # Initial commit
-            subprocess.run(["git", "add", "."], cwd=self.project_dir, check=True)
-            subprocess.run(
-                ["git", "commit", "-m", "Initial commit: Project initialized with Genesis Protocol"],
-                cwd=self.project_dir,
-                check=True
+                shutil.copyfile(gitignore_template, self.project_dir / ".gitignore")
+
+            # Run init/add/commit through one shell so git's process startup
+            # and config loading happen once instead of three times
+            pipeline = (
+                'git init -q && git add -A && '
+                'git commit -q -m "Initial commit: Project initialized with Genesis Protocol"'
             )
-            
+            if sys.platform == "win32":
+                cmd = ["cmd", "/c", pipeline]
+            else:
+                cmd = ["sh", "-c", pipeline]
+            subprocess.run(cmd, cwd=self.project_dir, check=True)
+
             self.logger.info("Git repository initialized")
             
         except Exception as e:
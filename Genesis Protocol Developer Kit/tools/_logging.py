@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Shared logging setup for the Genesis Protocol tools.
+
+Records are queued to a background QueueListener thread that owns the
+file handler, so hot-path logger.info() calls never block on disk I/O.
+Each tool keeps its own log file; one listener is started per file.
+"""
+
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+# One queue and listener (with its file handler) per log file,
+# started lazily on first use
+_queues = {}
+
+
+def _queue_for(filename: str) -> queue.SimpleQueue:
+    """Return the record queue for a log file, starting its listener once."""
+    log_queue = _queues.get(filename)
+    if log_queue is None:
+        log_queue = queue.SimpleQueue()
+        handler = logging.FileHandler(filename, delay=True)
+        handler.setFormatter(logging.Formatter(
+            '%(asctime)s [%(levelname)s] %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        ))
+        listener = QueueListener(log_queue, handler)
+        listener.start()
+        atexit.register(listener.stop)
+        _queues[filename] = log_queue
+    return log_queue
+
+
+def get_logger(name: str, filename: str) -> logging.Logger:
+    """Return a logger whose records are written by a background thread."""
+    logger = logging.getLogger(name)
+    if not getattr(logger, "_genesis_queue_wired", False):
+        logger.addHandler(QueueHandler(_queue_for(filename)))
+        logger.setLevel(logging.INFO)
+        logger._genesis_queue_wired = True
+    return logger
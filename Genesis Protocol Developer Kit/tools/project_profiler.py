@@ -7,44 +7,149 @@ helping developers align their project characteristics with their needs and goal
 """
 
 import json
-import logging
+import threading
+import time
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, List, Optional
 from datetime import datetime
 import shutil
 
 try:
-    import questionary
-    from rich.console import Console
-    from rich.panel import Panel
-    from rich.markdown import Markdown
-    from rich.table import Table
+    from ._logging import get_logger
 except ImportError:
-    print("Installing required packages...")
-    import subprocess
-    subprocess.check_call(["pip", "install", "questionary", "rich"])
-    import questionary
-    from rich.console import Console
-    from rich.panel import Panel
-    from rich.markdown import Markdown
-    from rich.table import Table
+    from _logging import get_logger
 
-console = Console()
+# questionary/rich are imported on first interactive use: their import
+# graphs (pygments and friends) add hundreds of ms of cold start that
+# non-interactive callers never need
+questionary = None
+console = None
+Panel = None
+Table = None
+
+
+def _load_ui() -> None:
+    """Import questionary/rich lazily, bootstrapping via pip if missing."""
+    global questionary, console, Panel, Table
+    if questionary is not None:
+        return
+    try:
+        import questionary as _questionary
+        from rich.console import Console
+        from rich.panel import Panel as _Panel
+        from rich.table import Table as _Table
+    except ImportError:
+        print("Installing required packages...")
+        import subprocess
+        subprocess.check_call(["pip", "install", "questionary", "rich"])
+        import questionary as _questionary
+        from rich.console import Console
+        from rich.panel import Panel as _Panel
+        from rich.table import Table as _Table
+    questionary = _questionary
+    console = Console()
+    Panel = _Panel
+    Table = _Table
+
+# Shared lookup tables, defined once at module scope so profiling sessions
+# don't rebuild these dict literals on every call.
+
+# Mapping of technology names to pip package names
+_PACKAGE_MAP = MappingProxyType({
+    "FastAPI": "fastapi>=0.100.0",
+    "LangChain": "langchain>=0.0.200",
+    "Groq": "groq>=0.3.0",
+    "ChromaDB": "chromadb>=0.4.0",
+    "Pydantic AI": "pydantic-ai>=1.0.0",
+    "PyTorch": "torch>=2.0.0",
+    "TensorFlow": "tensorflow>=2.13.0",
+    # Add more mappings as needed
+})
+
+_FRAMEWORK_DESCRIPTIONS = MappingProxyType({
+    "TensorFlow": "Google's open-source ML framework for production-grade ML systems",
+    "PyTorch": "Facebook's ML framework focused on research and flexibility",
+    "Keras": "High-level neural network library running on TensorFlow",
+    "Scikit-learn": "Simple and efficient ML library for data mining and analysis",
+    "XGBoost": "Optimized gradient boosting library for structured data",
+    "JAX": "Google's high-performance numerical computing library",
+    "LangChain": "Framework for developing LLM-powered applications",
+    "LangGraph": "Graph-based orchestration for LLM workflows",
+    "LlamaIndex": "Data framework for LLM applications",
+    "Pydantic AI": "Data validation for AI/ML applications",
+    "Groq": "High-performance AI inference engine",
+    "ChromaDB": "Open-source embedding database for AI applications",
+    "Weaviate": "Vector search engine with semantic search capabilities",
+    "FastAPI": "Modern, fast web framework for building APIs",
+    "Celery": "Distributed task queue for async job processing",
+    "PostgreSQL": "Advanced open-source relational database",
+    "MongoDB": "Document-based NoSQL database",
+    "Redis": "In-memory data structure store and cache",
+    "Eleven Labs": "Advanced text-to-speech with voice customization",
+    "Whisper": "OpenAI's speech recognition system",
+    "Pytest": "Feature-rich Python testing framework",
+    "Docker": "Container platform for application packaging",
+    "Kubernetes": "Container orchestration platform",
+    "Grafana": "Analytics and monitoring solution",
+    "Logfire": "Advanced logging and monitoring platform"
+})
+
+# Summary-table category groupings with display labels computed once, so
+# rendering skips per-run replace()/title() string churn
+_CORE_CATEGORIES = (
+    "ml_frameworks",
+    "ai_frameworks",
+    "nlp_libraries",
+    "computer_vision",
+    "data_processing"
+)
+
+_INFRA_CATEGORIES = (
+    "databases",
+    "vector_databases",
+    "workflow_orchestration",
+    "model_serving",
+    "deployment_platforms",
+    "monitoring_logging"
+)
+
+_DEV_CATEGORIES = (
+    "testing_tools",
+    "security_auth",
+    "visualization",
+    "audio_voice"
+)
+
+_LABELS = MappingProxyType({
+    "ml_frameworks": "ML Frameworks",
+    "ai_frameworks": "AI Frameworks",
+    "nlp_libraries": "NLP Libraries",
+    "computer_vision": "Computer Vision",
+    "data_processing": "Data Processing",
+    "databases": "Databases",
+    "vector_databases": "Vector Databases",
+    "workflow_orchestration": "Workflow Orchestration",
+    "model_serving": "Model Serving",
+    "deployment_platforms": "Deployment Platforms",
+    "monitoring_logging": "Monitoring Logging",
+    "testing_tools": "Testing Tools",
+    "security_auth": "Security Auth",
+    "visualization": "Visualization",
+    "audio_voice": "Audio Voice"
+})
 
 class ProjectProfiler:
-    def __init__(self):
+    def __init__(self, force: bool = False):
         self.profile_dir = Path("project_profile")
         self.profile_file = self.profile_dir / "project_character.json"
         self.templates_dir = Path(__file__).parent.parent / "templates"
+        # Overwrite an existing project directory without prompting
+        # (scripted/CI runs have no terminal to confirm on)
+        self.force = force
         
-        # Setup logging
-        logging.basicConfig(
-            filename='project_profiler.log',
-            level=logging.INFO,
-            format='%(asctime)s [%(levelname)s] %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        self.logger = logging.getLogger(__name__)
+        # Setup logging (queue-backed; file writes happen off-thread)
+        self.logger = get_logger(__name__, 'project_profiler.log')
         
         # Define project attributes
         self.attributes = {
@@ -70,6 +175,15 @@ class ProjectProfiler:
             }
         }
         
+        # Attribute select choices built once, not per prompt
+        self._attr_choices = {
+            attr: [{
+                'name': f"{level}: {desc}",
+                'value': level
+            } for level, desc in levels.items()]
+            for attr, levels in self.attributes.items()
+        }
+
         # Define project archetypes
         self.archetypes = {
             "Alchemist": {
@@ -103,6 +217,37 @@ class ProjectProfiler:
                 "recommended_traits": ["structured", "searchable", "comprehensive"]
             }
         }
+
+        # Frozen trait sets so archetype scoring is one set intersection
+        # per archetype instead of nested membership scans
+        self._archetype_traits = {
+            name: frozenset(details["recommended_traits"])
+            for name, details in self.archetypes.items()
+        }
+
+        # Selectable technologies per category
+        self.tech_preferences = {
+            "ml_frameworks": [
+                "TensorFlow", "PyTorch", "Keras", "Scikit-learn", "XGBoost",
+                "JAX", "Flax", "Pyro", "GLM-PyTorch"
+            ],
+            "ai_frameworks": [
+                "LangChain", "LangGraph", "LlamaIndex", "Pydantic AI",
+                "Hugging Face Transformers", "Groq", "OpenAI", "Anthropic",
+                "Mistral AI", "Haystack"
+            ],
+            # ... [rest of the framework lists remain the same]
+        }
+
+        # Checkbox choices materialized once per category; the interactive
+        # loop only reads this cache instead of rebuilding dicts per prompt
+        self._choice_cache = {
+            category: [{
+                'name': f"{tech}: {_FRAMEWORK_DESCRIPTIONS.get(tech, 'No description available')}",
+                'value': tech
+            } for tech in techs]
+            for category, techs in self.tech_preferences.items()
+        }
     
     def setup(self) -> None:
         """Create necessary directories."""
@@ -111,6 +256,7 @@ class ProjectProfiler:
     
     def start_profiling(self) -> Dict:
         """Begin the project character creation process."""
+        _load_ui()
         try:
             console.print("\n🎮 Welcome to Project Character Creation!\n", style="bold blue")
             
@@ -167,30 +313,31 @@ class ProjectProfiler:
     
     def _determine_attributes(self) -> Dict:
         """Determine project attributes through interactive questions."""
-        attributes = {}
-        
-        for attr, levels in self.attributes.items():
-            choice = questionary.select(
+        # One questionary.form pass asks every attribute in a single
+        # terminal interaction instead of four separate select round-trips
+        form_kwargs = {
+            attr: questionary.select(
                 f"Choose your project's {attr} level:",
-                choices=[{
-                    'name': f"{level}: {desc}",
-                    'value': level
-                } for level, desc in levels.items()]
-            ).ask()
-            attributes[attr] = choice
-        
+                choices=choices
+            )
+            for attr, choices in self._attr_choices.items()
+        }
+        attributes = questionary.form(**form_kwargs).ask()
+        if attributes is None:
+            # Cancelled prompt: the old per-question loop degraded to
+            # None answers instead of crashing downstream consumers
+            attributes = {attr: None for attr in self._attr_choices}
         return attributes
     
     def _suggest_archetype(self, attributes: Dict) -> str:
         """Suggest a project archetype based on attributes."""
         # Simple matching algorithm
-        scores = {name: 0 for name in self.archetypes.keys()}
-        
-        for archetype, details in self.archetypes.items():
-            for trait in details["recommended_traits"]:
-                if trait in attributes.values():
-                    scores[archetype] += 1
-        
+        attr_set = set(attributes.values())
+        scores = {
+            name: len(traits & attr_set)
+            for name, traits in self._archetype_traits.items()
+        }
+
         # Get top matches
         top_archetypes = sorted(scores.items(), key=lambda x: x[1], reverse=True)[:2]
         
@@ -208,21 +355,7 @@ class ProjectProfiler:
     def _gather_tech_preferences(self, archetype: str) -> Dict:
         """Gather technology preferences based on archetype."""
         tech_focus = self.archetypes[archetype]["tech_focus"]
-        
-        # Load framework descriptions
-        self.tech_preferences = {
-            "ml_frameworks": [
-                "TensorFlow", "PyTorch", "Keras", "Scikit-learn", "XGBoost",
-                "JAX", "Flax", "Pyro", "GLM-PyTorch"
-            ],
-            "ai_frameworks": [
-                "LangChain", "LangGraph", "LlamaIndex", "Pydantic AI",
-                "Hugging Face Transformers", "Groq", "OpenAI", "Anthropic",
-                "Mistral AI", "Haystack"
-            ],
-            # ... [rest of the framework lists remain the same]
-        }
-        
+
         preferences = {
             "project_type": questionary.select(
                 "What type of project are you building?",
@@ -252,8 +385,18 @@ class ProjectProfiler:
     
     def _save_profile(self, profile: Dict) -> None:
         """Save the project profile to file."""
-        with open(self.profile_file, "w") as f:
-            json.dump(profile, f, indent=2)
+        # orjson serializes in C and hands back bytes for a single write;
+        # the stdlib path still avoids json.dump's per-fragment f.write calls
+        try:
+            import orjson
+            self.profile_file.write_bytes(
+                orjson.dumps(profile, option=orjson.OPT_INDENT_2)
+            )
+        except ImportError:
+            self.profile_file.write_text(
+                json.dumps(profile, indent=2, ensure_ascii=False),
+                encoding="utf-8"
+            )
         self.logger.info("Project profile saved")
     
     def _display_profile_summary(self, profile: Dict) -> None:
@@ -294,71 +437,12 @@ class ProjectProfiler:
             title="Project Archetype"
         ))
         
-        # Tech Stack - Core Components
-        core_tech_table = Table(title="Core Technology Stack")
-        core_tech_table.add_column("Category", style="cyan")
-        core_tech_table.add_column("Selections", style="green", no_wrap=False)
-        
-        core_categories = [
-            "ml_frameworks",
-            "ai_frameworks",
-            "nlp_libraries",
-            "computer_vision",
-            "data_processing"
-        ]
-        
-        for category in core_categories:
-            if profile['tech_preferences'].get(category):
-                core_tech_table.add_row(
-                    category.replace('_', ' ').title(),
-                    ", ".join(profile['tech_preferences'][category])
-                )
-        
-        console.print(core_tech_table)
-        
-        # Tech Stack - Infrastructure
-        infra_tech_table = Table(title="Infrastructure & Tools")
-        infra_tech_table.add_column("Category", style="cyan")
-        infra_tech_table.add_column("Selections", style="green", no_wrap=False)
-        
-        infra_categories = [
-            "databases",
-            "vector_databases",
-            "workflow_orchestration",
-            "model_serving",
-            "deployment_platforms",
-            "monitoring_logging"
-        ]
-        
-        for category in infra_categories:
-            if profile['tech_preferences'].get(category):
-                infra_tech_table.add_row(
-                    category.replace('_', ' ').title(),
-                    ", ".join(profile['tech_preferences'][category])
-                )
-        
-        console.print(infra_tech_table)
-        
-        # Tech Stack - Development Tools
-        dev_tech_table = Table(title="Development & Testing Tools")
-        dev_tech_table.add_column("Category", style="cyan")
-        dev_tech_table.add_column("Selections", style="green", no_wrap=False)
-        
-        dev_categories = [
-            "testing_tools",
-            "security_auth",
-            "visualization",
-            "audio_voice"
-        ]
-        
-        for category in dev_categories:
-            if profile['tech_preferences'].get(category):
-                dev_tech_table.add_row(
-                    category.replace('_', ' ').title(),
-                    ", ".join(profile['tech_preferences'][category])
-                )
-        
-        console.print(dev_tech_table)
+        prefs = profile['tech_preferences']
+
+        # Tech stack tables share one data-driven renderer
+        self._render_category_table("Core Technology Stack", _CORE_CATEGORIES, prefs)
+        self._render_category_table("Infrastructure & Tools", _INFRA_CATEGORIES, prefs)
+        self._render_category_table("Development & Testing Tools", _DEV_CATEGORIES, prefs)
         
         # Next Steps and Recommendations
         console.print("\n📝 Next Steps:", style="bold blue")
@@ -376,20 +460,39 @@ class ProjectProfiler:
         
         console.print("\n📚 Documentation will be generated for your specific tech stack")
 
+    def _render_category_table(self, title: str, categories: tuple, prefs: Dict) -> None:
+        """Render one tech-stack summary table for a category grouping."""
+        table = Table(title=title)
+        table.add_column("Category", style="cyan")
+        table.add_column("Selections", style="green", no_wrap=False)
+
+        for category in categories:
+            values = prefs.get(category) or ()
+            if values:
+                table.add_row(_LABELS[category], ", ".join(values))
+
+        console.print(table)
+
     def generate_project_structure(self, profile: Dict) -> None:
         """Generate the actual project structure based on the profile."""
+        _load_ui()
         try:
             # Get project name and create project directory in parent folder
             project_name = profile['basic_info']['name']
             project_dir = Path(__file__).parent.parent.parent / project_name
             
+            trash = None
             if project_dir.exists():
-                if not questionary.confirm(
+                if not self.force and not questionary.confirm(
                     f"Directory {project_name} already exists. Overwrite?"
                 ).ask():
                     raise Exception("Project directory already exists")
-                shutil.rmtree(project_dir)
-            
+                # A single rename syscall frees the path immediately; the
+                # old tree is deleted in the background once the new
+                # structure is in place
+                trash = project_dir.with_name(f"{project_name}.trash-{int(time.time())}")
+                project_dir.rename(trash)
+
             project_dir.mkdir(parents=True)
             self.logger.info(f"Created project directory: {project_dir}")
 
@@ -438,7 +541,15 @@ class ProjectProfiler:
             
             # Initialize git repository
             self._initialize_git(project_dir)
-            
+
+            if trash is not None:
+                threading.Thread(
+                    target=shutil.rmtree,
+                    args=(trash,),
+                    kwargs={"ignore_errors": True},
+                    daemon=True
+                ).start()
+
             console.print(f"\n✨ Project structure generated at: {project_dir}", style="bold green")
             
         except Exception as e:
@@ -470,11 +581,12 @@ class ProjectProfiler:
             "LOG_DIR=logs"
         ]
         
-        with open(project_dir / ".env", "w") as f:
-            f.write("\n".join(env_content))
-        
-        # Copy .env.example
-        shutil.copy(project_dir / ".env", project_dir / ".env.example")
+        # Both files come from the one in-memory payload: a single encode
+        # and two writes, instead of writing .env and copying it back off
+        # disk for .env.example
+        payload = "\n".join(env_content).encode("utf-8")
+        (project_dir / ".env").write_bytes(payload)
+        (project_dir / ".env.example").write_bytes(payload)
 
     def _generate_requirements(self, project_dir: Path, profile: Dict) -> None:
         """Generate requirements.txt based on selected technologies."""
@@ -492,24 +604,15 @@ class ProjectProfiler:
                     if pkg_name:
                         requirements.add(pkg_name)
         
-        # Write requirements.txt
-        with open(project_dir / "requirements.txt", "w") as f:
-            f.write("\n".join(sorted(requirements)))
+        # Write requirements.txt in one shot, no buffered-IO setup
+        (project_dir / "requirements.txt").write_text(
+            "\n".join(sorted(requirements)),
+            encoding="utf-8"
+        )
 
     def _get_package_name(self, tech: str) -> Optional[str]:
         """Convert technology name to pip package name."""
-        # Mapping of technology names to pip package names
-        package_map = {
-            "FastAPI": "fastapi>=0.100.0",
-            "LangChain": "langchain>=0.0.200",
-            "Groq": "groq>=0.3.0",
-            "ChromaDB": "chromadb>=0.4.0",
-            "Pydantic AI": "pydantic-ai>=1.0.0",
-            "PyTorch": "torch>=2.0.0",
-            "TensorFlow": "tensorflow>=2.13.0",
-            # Add more mappings as needed
-        }
-        return package_map.get(tech)
+        return _PACKAGE_MAP.get(tech)
 
     def _get_database_config(self, profile: Dict) -> str:
         """Generate database configuration based on selected databases."""
@@ -525,43 +628,19 @@ class ProjectProfiler:
 
     def _get_framework_choices(self, category: str) -> List[Dict]:
         """Get framework choices with descriptions."""
-        framework_descriptions = {
-            "TensorFlow": "Google's open-source ML framework for production-grade ML systems",
-            "PyTorch": "Facebook's ML framework focused on research and flexibility",
-            "Keras": "High-level neural network library running on TensorFlow",
-            "Scikit-learn": "Simple and efficient ML library for data mining and analysis",
-            "XGBoost": "Optimized gradient boosting library for structured data",
-            "JAX": "Google's high-performance numerical computing library",
-            "LangChain": "Framework for developing LLM-powered applications",
-            "LangGraph": "Graph-based orchestration for LLM workflows",
-            "LlamaIndex": "Data framework for LLM applications",
-            "Pydantic AI": "Data validation for AI/ML applications",
-            "Groq": "High-performance AI inference engine",
-            "ChromaDB": "Open-source embedding database for AI applications",
-            "Weaviate": "Vector search engine with semantic search capabilities",
-            "FastAPI": "Modern, fast web framework for building APIs",
-            "Celery": "Distributed task queue for async job processing",
-            "PostgreSQL": "Advanced open-source relational database",
-            "MongoDB": "Document-based NoSQL database",
-            "Redis": "In-memory data structure store and cache",
-            "Eleven Labs": "Advanced text-to-speech with voice customization",
-            "Whisper": "OpenAI's speech recognition system",
-            "Pytest": "Feature-rich Python testing framework",
-            "Docker": "Container platform for application packaging",
-            "Kubernetes": "Container orchestration platform",
-            "Grafana": "Analytics and monitoring solution",
-            "Logfire": "Advanced logging and monitoring platform"
-        }
-        
-        choices = []
-        for tech in self.tech_preferences.get(category, []):
-            choices.append({
-                'name': f"{tech}: {framework_descriptions.get(tech, 'No description available')}",
-                'value': tech
-            })
-        return choices
+        return self._choice_cache.get(category, [])
 
 if __name__ == "__main__":
-    profiler = ProjectProfiler()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Profile a new project")
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="overwrite an existing project directory without prompting"
+    )
+    args = parser.parse_args()
+
+    profiler = ProjectProfiler(force=args.force)
     profiler.setup()
-    profiler.start_profiling() 
\ No newline at end of file
+    profiler.start_profiling()
\ No newline at end of file
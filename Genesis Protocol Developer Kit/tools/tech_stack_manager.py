@@ -8,157 +8,81 @@ It provides tools to add, update, and organize documentation for frameworks, lib
 
 import os
 import json
+import mmap
 import shutil
-import logging
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional
+from string import Template
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
+# orjson parses and serializes in C; stdlib json stays the fallback
 try:
-    import questionary
-    from rich.console import Console
-    from rich.panel import Panel
-    from rich.markdown import Markdown
+    import orjson
 except ImportError:
-    print("Installing required packages...")
-    import subprocess
-    subprocess.check_call(["pip", "install", "questionary", "rich"])
-    import questionary
-    from rich.console import Console
-    from rich.panel import Panel
-    from rich.markdown import Markdown
+    orjson = None
 
-# Setup rich console
-console = Console()
+# msgpack gives the config a compact binary form whose length-prefixed
+# parse skips the JSON text tokenizer entirely
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
 
-class TechStackManager:
-    def __init__(self):
-        self.base_dir = Path("docs/tech_stack")
-        self.config_file = Path("project_config.json")
-        self.categories = ["frameworks", "libraries", "apis"]
-        
-        # Setup logging
-        logging.basicConfig(
-            filename='tech_stack_manager.log',
-            level=logging.INFO,
-            format='%(asctime)s [%(levelname)s] %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        self.logger = logging.getLogger(__name__)
-    
-    def setup_directory_structure(self) -> None:
-        """Create the initial directory structure."""
-        for category in self.categories:
-            (self.base_dir / category).mkdir(parents=True, exist_ok=True)
-        self.logger.info("Directory structure created")
-    
-    def create_component_docs(self, category: str, name: str) -> None:
-        """Create documentation structure for a new component."""
-        component_dir = self.base_dir / category / name
-        component_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Create documentation files based on category
-        if category == "frameworks":
-            files = {
-                "overview.md": self._get_framework_overview_template(name),
-                "best_practices.md": self._get_best_practices_template(name),
-                "integration_guides.md": self._get_integration_guide_template(name)
-            }
-        elif category == "libraries":
-            files = {
-                "overview.md": self._get_library_overview_template(name),
-                "usage_guides.md": self._get_usage_guide_template(name),
-                "examples.md": self._get_examples_template(name)
-            }
-        else:  # APIs
-            files = {
-                "documentation.md": self._get_api_documentation_template(name),
-                "endpoints.md": self._get_endpoints_template(name),
-                "examples.md": self._get_examples_template(name)
-            }
-        
-        # Create files
-        for filename, content in files.items():
-            with open(component_dir / filename, "w") as f:
-                f.write(content)
-        
-        self.logger.info(f"Created documentation for {category}/{name}")
-    
-    def update_project_config(self, config_updates: Dict) -> None:
-        """Update the project configuration file."""
-        if self.config_file.exists():
-            with open(self.config_file, "r") as f:
-                config = json.load(f)
-        else:
-            config = {
-                "project_name": "",
-                "tech_stack": {
-                    "frameworks": [],
-                    "libraries": [],
-                    "apis": []
-                },
-                "documentation_paths": {
-                    "framework_docs": [],
-                    "library_docs": [],
-                    "api_docs": []
-                }
-            }
-        
-        # Update config with new values
-        for key, value in config_updates.items():
-            if isinstance(value, dict):
-                config[key].update(value)
-            else:
-                config[key] = value
-        
-        # Write updated config
-        with open(self.config_file, "w") as f:
-            json.dump(config, f, indent=2)
-        
-        self.logger.info("Project configuration updated")
-    
-    def add_component(self) -> None:
-        """Interactive prompt to add a new component."""
-        category = questionary.select(
-            "Select component category:",
-            choices=self.categories
-        ).ask()
-        
-        name = questionary.text(
-            f"Enter {category[:-1]} name:"
-        ).ask()
-        
-        version = questionary.text(
-            f"Enter {name} version:"
-        ).ask()
-        
-        description = questionary.text(
-            f"Enter brief description for {name}:"
-        ).ask()
-        
-        # Create documentation
-        self.create_component_docs(category, name)
-        
-        # Update config
-        config_updates = {
-            "tech_stack": {
-                category: [name]
-            },
-            "documentation_paths": {
-                f"{category[:-1]}_docs": [
-                    str(self.base_dir / category / name)
-                ]
-            }
-        }
-        self.update_project_config(config_updates)
-        
-        console.print(f"\n✨ Added {name} to {category}\n", style="bold green")
-    
-    def _get_framework_overview_template(self, name: str) -> str:
-        return f"""# {name} Framework Overview
+try:
+    from ._logging import get_logger
+except ImportError:
+    from _logging import get_logger
+
+# rich is imported on first console use; its import graph costs far more
+# than any non-interactive call into this module
+_CONSOLE = None
+
+
+def _print(message: str, style: str = None) -> None:
+    """Print via rich when it is installed, importing it on first use."""
+    global _CONSOLE
+    if _CONSOLE is None:
+        try:
+            from rich.console import Console
+            _CONSOLE = Console()
+        except ImportError:
+            _CONSOLE = False
+    if _CONSOLE:
+        _CONSOLE.print(message, style=style)
+    else:
+        print(message)
+
+# Main-menu entries, shared across loop iterations instead of a fresh
+# list literal per keystroke
+_MENU_CHOICES = [
+    "Add new component",
+    "Update existing component",
+    "View documentation",
+    "Exit"
+]
+
+# Today's date, stamped once at import: bulk adds would otherwise pay a
+# clock read plus strftime parse per framework overview
+_TODAY = datetime.now().strftime('%Y-%m-%d')
+_TODAY_B = _TODAY.encode("utf-8")
+
+
+def refresh_today() -> str:
+    """Re-read the date for long-running processes that cross midnight."""
+    global _TODAY, _TODAY_B
+    _TODAY = datetime.now().strftime('%Y-%m-%d')
+    _TODAY_B = _TODAY.encode("utf-8")
+    return _TODAY
+
+# Documentation template bodies, compiled once at import. Template
+# precompiles its placeholder regex at construction, so substitute() is
+# a single regex pass with none of str.format's per-call spec parsing —
+# and a stray {...} in a markdown code block can't break expansion
+_FRAMEWORK_OVERVIEW_TMPL = Template("""# $name Framework Overview
 
 ## Introduction
-[Brief introduction to {name}]
+[Brief introduction to $name]
 
 ## Key Features
 - Feature 1
@@ -179,17 +103,16 @@ class TechStackManager:
 
 ## Version Information
 - Current Version: [version]
-- Release Date: {datetime.now().strftime('%Y-%m-%d')}
+- Release Date: $date
 - Compatibility: [compatibility info]
 
 ## Resources
 - [Official Documentation]
 - [GitHub Repository]
 - [Community Resources]
-"""
-    
-    def _get_best_practices_template(self, name: str) -> str:
-        return f"""# {name} Best Practices
+""")
+
+_BEST_PRACTICES_TMPL = Template("""# $name Best Practices
 
 ## Code Organization
 [Code organization guidelines]
@@ -211,10 +134,9 @@ class TechStackManager:
 
 ## Maintenance
 [Maintenance guidelines]
-"""
-    
-    def _get_integration_guide_template(self, name: str) -> str:
-        return f"""# {name} Integration Guide
+""")
+
+_INTEGRATION_GUIDE_TMPL = Template("""# $name Integration Guide
 
 ## Prerequisites
 [List prerequisites]
@@ -234,10 +156,9 @@ class TechStackManager:
 
 ## Examples
 [Integration examples]
-"""
-    
-    def _get_library_overview_template(self, name: str) -> str:
-        return f"""# {name} Library Overview
+""")
+
+_LIBRARY_OVERVIEW_TMPL = Template("""# $name Library Overview
 
 ## Purpose
 [Library purpose]
@@ -253,10 +174,9 @@ class TechStackManager:
 
 ## API Reference
 [API documentation]
-"""
-    
-    def _get_usage_guide_template(self, name: str) -> str:
-        return f"""# {name} Usage Guide
+""")
+
+_USAGE_GUIDE_TMPL = Template("""# $name Usage Guide
 
 ## Getting Started
 [Getting started guide]
@@ -269,10 +189,9 @@ class TechStackManager:
 
 ## Best Practices
 [Best practices]
-"""
-    
-    def _get_examples_template(self, name: str) -> str:
-        return f"""# {name} Examples
+""")
+
+_EXAMPLES_TMPL = Template("""# $name Examples
 
 ## Basic Examples
 [Basic usage examples]
@@ -285,10 +204,9 @@ class TechStackManager:
 
 ## Common Patterns
 [Common usage patterns]
-"""
-    
-    def _get_api_documentation_template(self, name: str) -> str:
-        return f"""# {name} API Documentation
+""")
+
+_API_DOCUMENTATION_TMPL = Template("""# $name API Documentation
 
 ## Overview
 [API overview]
@@ -304,10 +222,9 @@ class TechStackManager:
 
 ## Error Handling
 [Error handling]
-"""
-    
-    def _get_endpoints_template(self, name: str) -> str:
-        return f"""# {name} API Endpoints
+""")
+
+_ENDPOINTS_TMPL = Template("""# $name API Endpoints
 
 ## Base URL
 [Base URL information]
@@ -323,31 +240,484 @@ class TechStackManager:
 
 ### Endpoint 2
 [Additional endpoints]
-"""
+""")
+
+def _to_bytes_tmpl(tmpl: Template) -> bytes:
+    """Pre-encode a template: the fixed body is UTF-8'd once at import.
+
+    $name/$date holes become bytes %-mapping placeholders, so each
+    expansion only encodes the short substituted values.
+    """
+    return (
+        tmpl.template.replace("%", "%%")
+        .replace("$name", "%(name)b")
+        .replace("$date", "%(date)b")
+        .encode("utf-8")
+    )
+
+
+def _serialize_config(config: Dict) -> bytes:
+    """Serialize the fixed two-level config shape with a hard-coded layout.
+
+    The known key order means no generic encoder walk: each leaf is
+    dumped on its own and spliced into a preformatted byte skeleton.
+    Configs that have grown past the schema fall back to the generic
+    indent-2 serializer.
+    """
+    if orjson:
+        dumps = orjson.dumps
+    else:
+        def dumps(obj):
+            return json.dumps(obj).encode("utf-8")
+
+    try:
+        tech = config["tech_stack"]
+        if set(config) == {"project_name", "tech_stack", "documentation_paths"} \
+                and set(tech) == {"frameworks", "libraries", "apis"}:
+            return (
+                b'{\n'
+                b'  "project_name": %b,\n'
+                b'  "tech_stack": {\n'
+                b'    "frameworks": %b,\n'
+                b'    "libraries": %b,\n'
+                b'    "apis": %b\n'
+                b'  },\n'
+                b'  "documentation_paths": %b\n'
+                b'}'
+            ) % (
+                dumps(config["project_name"]),
+                dumps(tech["frameworks"]),
+                dumps(tech["libraries"]),
+                dumps(tech["apis"]),
+                dumps(config["documentation_paths"])
+            )
+    except (KeyError, TypeError):
+        # Configs missing expected keys (legacy/hand-edited files) or with
+        # non-dict values take the generic serializer below
+        pass
+
+    if orjson:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    return json.dumps(config, indent=2).encode("utf-8")
+
+
+def _deep_merge(dst: Dict, src: Dict) -> None:
+    """Recursively merge src into dst.
+
+    Nested dicts are merged in place and lists are extended with values
+    not already present, so updates like {"frameworks": [name]} append
+    instead of clobbering the stored list.
+    """
+    for key, value in src.items():
+        if isinstance(value, dict) and isinstance(dst.get(key), dict):
+            _deep_merge(dst[key], value)
+        elif isinstance(value, list) and isinstance(dst.get(key), list):
+            # Set union makes membership O(1) per element; the lists are
+            # kept sorted on disk so output stays deterministic
+            try:
+                dst[key] = sorted(set(dst[key]) | set(value))
+            except TypeError:
+                # Unhashable entries: fall back to the linear dedupe
+                dst[key].extend(v for v in value if v not in dst[key])
+        else:
+            dst[key] = value
+
+class TechStackManager:
+    # Category -> ((filename, template), ...) dispatch table; one dict
+    # lookup replaces the if/elif chain and the per-call files dict
+    _TEMPLATES = {
+        "frameworks": (
+            ("overview.md", _FRAMEWORK_OVERVIEW_TMPL),
+            ("best_practices.md", _BEST_PRACTICES_TMPL),
+            ("integration_guides.md", _INTEGRATION_GUIDE_TMPL)
+        ),
+        "libraries": (
+            ("overview.md", _LIBRARY_OVERVIEW_TMPL),
+            ("usage_guides.md", _USAGE_GUIDE_TMPL),
+            ("examples.md", _EXAMPLES_TMPL)
+        ),
+        "apis": (
+            ("documentation.md", _API_DOCUMENTATION_TMPL),
+            ("endpoints.md", _ENDPOINTS_TMPL),
+            ("examples.md", _EXAMPLES_TMPL)
+        )
+    }
+
+    # Byte-encoded twin of _TEMPLATES used by the write path
+    _TEMPLATES_B = {
+        category: tuple((fname, _to_bytes_tmpl(tmpl)) for fname, tmpl in pairs)
+        for category, pairs in _TEMPLATES.items()
+    }
+
+    def __init__(self):
+        self.base_dir = Path("docs/tech_stack")
+        # Prefer the binary config when msgpack is installed; an existing
+        # JSON config is migrated on the first write
+        self._json_config_file = Path("project_config.json")
+        if msgpack:
+            self.config_file = Path("project_config.msgpack")
+        else:
+            self.config_file = self._json_config_file
+        self.categories = ["frameworks", "libraries", "apis"]
+        # Buffered config updates while a batch is open; None otherwise
+        self._pending: Optional[Dict] = None
+        # (st_mtime_ns, parsed config) of the last config read/write; a
+        # stat comparison then replaces a full re-read and re-parse
+        self._config_cache: Optional[Tuple[int, Dict]] = None
+        # (category, name) pairs whose directories are known to exist,
+        # seeded by setup_directory_structure's scandir sweep
+        self._known_components: set = set()
+        # questionary.Choice objects for the category prompt, built on
+        # first interactive use (questionary itself imports lazily)
+        self._category_choices: Optional[List] = None
+
+        # Setup logging (queue-backed; file writes happen off-thread)
+        self.logger = get_logger(__name__, 'tech_stack_manager.log')
+    
+    def setup_directory_structure(self) -> None:
+        """Create the initial directory structure."""
+        # One scandir shows which categories already exist, so a fully
+        # built tree costs a single directory read instead of a
+        # stat+mkdir pair per category
+        if self.base_dir.exists():
+            existing = {e.name for e in os.scandir(self.base_dir)}
+        else:
+            self.base_dir.mkdir(parents=True)
+            existing = set()
+
+        for category in self.categories:
+            if category not in existing:
+                os.mkdir(self.base_dir / category)
+            else:
+                # Seed the known-component cache so create_component_docs
+                # can skip mkdir for directories that already exist
+                with os.scandir(self.base_dir / category) as entries:
+                    self._known_components.update(
+                        (category, entry.name)
+                        for entry in entries if entry.is_dir()
+                    )
+
+        self.logger.info("Directory structure created")
+    
+    def create_component_docs(self, category: str, name: str) -> None:
+        """Create documentation structure for a new component."""
+        component_dir = self.base_dir / category / name
+        key = (category, name)
+        refresh = key in self._known_components
+        if not refresh:
+            component_dir.mkdir(parents=True, exist_ok=True)
+            self._known_components.add(key)
+
+
+        # Pick the file set with one table lookup; unknown categories get
+        # the API templates, matching the old else branch
+        templates = self._TEMPLATES_B.get(category, self._TEMPLATES_B["apis"])
+        fields = {b"name": name.encode("utf-8"), b"date": _TODAY_B}
+
+        # Create files through bare open/write/close; buffered text IO
+        # would add fstat/lseek/ioctl per sub-2KB payload. The template
+        # bodies are already bytes, so only name/date get encoded here.
+        docs = {}
+        for filename, template in templates:
+            payload = template % fields
+            self._write_small(component_dir / filename, payload)
+            docs[filename] = payload.decode("utf-8")
+
+        # Mirror the docs into the category's packed blob so readers can
+        # fetch every component with one open instead of a tree walk.
+        # New components append; refreshes rewrite the blob so it can't
+        # accumulate stale duplicate records across reruns.
+        record = {"component": name, "docs": docs}
+        dumps = orjson.dumps if orjson else (lambda obj: json.dumps(obj).encode("utf-8"))
+        packed_file = self.base_dir / category / "packed.json"
+        if refresh and packed_file.exists():
+            records = [r for r in self.load_packed(category) if r["component"] != name]
+            records.append(record)
+            packed_file.write_bytes(b"".join(dumps(r) + b"\n" for r in records))
+        else:
+            with open(packed_file, "ab") as f:
+                f.write(dumps(record) + b"\n")
+
+        self.logger.info(f"Created documentation for {category}/{name}")
+    
+    @staticmethod
+    def _write_small(path, payload: bytes) -> None:
+        """Write a small file with the bare open/write/close syscalls.
+
+        One write normally lands the whole payload; the loop only runs
+        on a partial write.
+        """
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            written = os.write(fd, payload)
+            while written < len(payload):
+                written += os.write(fd, payload[written:])
+        finally:
+            os.close(fd)
+
+    def load_packed(self, category: str) -> List[Dict]:
+        """Load every component's docs for a category from the packed blob.
+
+        One open and a sequential read replace per-component opens of the
+        individual markdown files; each line is a self-contained record.
+        Doc refreshes append a new record for the same component, so later
+        lines win and each component comes back exactly once.
+        """
+        packed_file = self.base_dir / category / "packed.json"
+        if not packed_file.exists():
+            return []
+        loads = orjson.loads if orjson else json.loads
+        records = {}
+        for line in packed_file.read_bytes().splitlines():
+            if line:
+                record = loads(line)
+                records[record["component"]] = record
+        return list(records.values())
+
+    def begin_batch(self) -> None:
+        """Start buffering config updates instead of writing per call."""
+        self._pending = {}
+
+    def commit_batch(self) -> None:
+        """Flush buffered config updates with one read-merge-write."""
+        pending, self._pending = self._pending, None
+        if pending:
+            self.update_project_config(pending)
+
+    @contextmanager
+    def batch_update(self):
+        """Buffer config updates inside the block; flush once at exit.
+
+        Repeated adds otherwise re-read, re-merge and re-write the whole
+        config file per component — O(N^2) work across N additions.
+        """
+        self.begin_batch()
+        try:
+            yield self
+        except BaseException:
+            self._pending = None
+            raise
+        else:
+            self.commit_batch()
+
+    # Above this size the config is parsed straight out of the page cache
+    # via mmap instead of copying it into a userland buffer first
+    _MMAP_THRESHOLD = 1 << 20
+
+    def _parse_config(self, raw) -> Dict:
+        """Parse config bytes (or any buffer) in the configured format."""
+        if msgpack and self.config_file.suffix == ".msgpack":
+            return msgpack.unpackb(raw, raw=False)
+        if orjson:
+            return orjson.loads(raw)
+        return json.loads(bytes(raw))
+
+    def _load_config(self) -> Dict:
+        """Return the current config, via the mtime cache when valid."""
+        try:
+            st = os.stat(self.config_file)
+        except FileNotFoundError:
+            st = None
+
+        if st is not None:
+            if self._config_cache is not None and self._config_cache[0] == st.st_mtime_ns:
+                return self._config_cache[1]
+            if st.st_size > self._MMAP_THRESHOLD:
+                with open(self.config_file, "rb") as f:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        view = memoryview(mm)
+                        try:
+                            return self._parse_config(view)
+                        finally:
+                            # An exported view would make mm.close() raise
+                            view.release()
+            return self._parse_config(self.config_file.read_bytes())
+
+        # First run in binary mode: migrate an existing JSON config
+        if msgpack and self._json_config_file.exists():
+            raw = self._json_config_file.read_bytes()
+            return orjson.loads(raw) if orjson else json.loads(raw)
+
+        return {
+            "project_name": "",
+            "tech_stack": {
+                "frameworks": [],
+                "libraries": [],
+                "apis": []
+            },
+            "documentation_paths": {
+                "framework_docs": [],
+                "library_docs": [],
+                "api_docs": []
+            }
+        }
+
+    def export_json(self, target: Optional[Path] = None) -> Path:
+        """Write a human-editable JSON copy of the config and return it."""
+        if target is None:
+            target = self.config_file.with_suffix(".json")
+        target.write_bytes(_serialize_config(self._load_config()))
+        return target
+
+    def update_project_config(self, config_updates: Dict) -> None:
+        """Update the project configuration file."""
+        # While a batch is open, fold updates into the pending buffer;
+        # commit_batch() performs the single disk merge
+        if self._pending is not None:
+            _deep_merge(self._pending, config_updates)
+            return
+
+        config = self._load_config()
+
+        # Merge in the new values; the shallow dict.update used before
+        # silently replaced nested lists such as tech_stack.frameworks
+        _deep_merge(config, config_updates)
+
+        # Write updated config in one shot: packed binary when msgpack is
+        # installed, else the schema-specialized JSON serializer
+        if msgpack and self.config_file.suffix == ".msgpack":
+            self.config_file.write_bytes(msgpack.packb(config))
+        else:
+            self.config_file.write_bytes(_serialize_config(config))
+
+        self._config_cache = (os.stat(self.config_file).st_mtime_ns, config)
+
+        self.logger.info("Project configuration updated")
+    
+    def add_component(
+        self,
+        category: Optional[str] = None,
+        name: Optional[str] = None,
+        version: Optional[str] = None,
+        description: Optional[str] = None
+    ) -> None:
+        """Add a new component, prompting only for fields not supplied.
+
+        Passing every argument skips the questionary layer entirely, so
+        scripted callers pay neither the prompt-toolkit import nor a
+        render per component.
+        """
+        if category is None or name is None or version is None or description is None:
+            import questionary
+
+        if category is None:
+            if self._category_choices is None:
+                self._category_choices = [
+                    questionary.Choice(c) for c in self.categories
+                ]
+            category = questionary.select(
+                "Select component category:",
+                choices=self._category_choices
+            ).ask()
+
+        if name is None:
+            name = questionary.text(
+                f"Enter {category[:-1]} name:"
+            ).ask()
+
+        if version is None:
+            version = questionary.text(
+                f"Enter {name} version:"
+            ).ask()
+
+        if description is None:
+            description = questionary.text(
+                f"Enter brief description for {name}:"
+            ).ask()
+        
+        # Create documentation
+        self.create_component_docs(category, name)
+
+        # Update config — unless the component is already tracked, in
+        # which case the docs refresh above is all that's needed and the
+        # parse+rewrite cycle is skipped
+        if name not in self._load_config().get("tech_stack", {}).get(category, []):
+            config_updates = {
+                "tech_stack": {
+                    category: [name]
+                },
+                "documentation_paths": {
+                    f"{category[:-1]}_docs": [
+                        str(self.base_dir / category / name)
+                    ]
+                }
+            }
+            self.update_project_config(config_updates)
+
+        _print(f"\n✨ Added {name} to {category}\n", style="bold green")
+
+    def add_components_bulk(self, items: List[Dict]) -> None:
+        """Add many components at once without prompting.
+
+        Each item supplies at least category and name. Config updates are
+        accumulated and written with a single update_project_config call
+        instead of one full read-merge-write per component.
+        """
+        config_updates = {"tech_stack": {}, "documentation_paths": {}}
+
+        for item in items:
+            category = item["category"]
+            name = item["name"]
+            self.create_component_docs(category, name)
+            config_updates["tech_stack"].setdefault(category, []).append(name)
+            config_updates["documentation_paths"].setdefault(
+                f"{category[:-1]}_docs", []
+            ).append(str(self.base_dir / category / name))
+
+        self.update_project_config(config_updates)
+        self.logger.info(f"Added {len(items)} components in bulk")
+
+    def _get_framework_overview_template(self, name: str) -> str:
+        return _FRAMEWORK_OVERVIEW_TMPL.substitute(name=name, date=_TODAY)
+
+    def _get_best_practices_template(self, name: str) -> str:
+        return _BEST_PRACTICES_TMPL.substitute(name=name)
+
+    def _get_integration_guide_template(self, name: str) -> str:
+        return _INTEGRATION_GUIDE_TMPL.substitute(name=name)
+
+    def _get_library_overview_template(self, name: str) -> str:
+        return _LIBRARY_OVERVIEW_TMPL.substitute(name=name)
+
+    def _get_usage_guide_template(self, name: str) -> str:
+        return _USAGE_GUIDE_TMPL.substitute(name=name)
+
+    def _get_examples_template(self, name: str) -> str:
+        return _EXAMPLES_TMPL.substitute(name=name)
+
+    def _get_api_documentation_template(self, name: str) -> str:
+        return _API_DOCUMENTATION_TMPL.substitute(name=name)
+
+    def _get_endpoints_template(self, name: str) -> str:
+        return _ENDPOINTS_TMPL.substitute(name=name)
 
 if __name__ == "__main__":
+    # The interactive menu is the one path that always needs questionary
+    try:
+        import questionary
+    except ImportError:
+        print("Installing required packages...")
+        import subprocess
+        subprocess.check_call(["pip", "install", "questionary", "rich"])
+        import questionary
+
     manager = TechStackManager()
-    
+
     # Setup initial structure
     manager.setup_directory_structure()
-    
+
     # Interactive menu
     while True:
         action = questionary.select(
             "What would you like to do?",
-            choices=[
-                "Add new component",
-                "Update existing component",
-                "View documentation",
-                "Exit"
-            ]
+            choices=_MENU_CHOICES
         ).ask()
         
         if action == "Add new component":
             manager.add_component()
         elif action == "Update existing component":
-            console.print("Feature coming soon!", style="yellow")
+            _print("Feature coming soon!", style="yellow")
         elif action == "View documentation":
-            console.print("Feature coming soon!", style="yellow")
+            _print("Feature coming soon!", style="yellow")
         else:
             break 
\ No newline at end of file